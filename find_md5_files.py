@@ -25,7 +25,12 @@ import re
 import sys
 from typing import List
 
+# my modules
+from scanner import DEFAULT_THREADS, scan_paths
+from shard import parse_shard, select_shard, shard_name
+
 EXTENSIONS = ['.mkv','.mov', '.mp4', '.tif', '.jpg']
+BAG_PATTERN = re.compile('^.*s-([a-z0-9]{1,}-)*bag$')
 
 MD5_PATTERN = re.compile(
     r"^(?:(?P<prefix>.*?)\s+)?"      # optionaler Präfix-Text + Whitespace
@@ -39,12 +44,14 @@ def parse_options(argv: List[str]) ->dict:
 
     OPTIONS:
         -h|--help              show help
+        -s|--shard=i/N         process only the i-th of N disjoint parts of the input
+        -t|--threads=n         number of threads listing directories concurrently (default: 16)
         -v|--verbose           print infomation
 
     """
-    options = { 'args': [], 'verbose': False, 'showUsage': False, 'message': 0 }
+    options = { 'args': [], 'verbose': False, 'shard': None, 'threads': DEFAULT_THREADS, 'showUsage': False, 'message': 0 }
     try:
-        opts, args = getopt.getopt(argv, "hv", ["help","verbose"])
+        opts, args = getopt.getopt(argv, "hs:t:v", ["help","shard=","threads=","verbose"])
     except getopt.GetoptError:
         options['showUsage'] = True 
         options['message'] = 2 
@@ -55,6 +62,20 @@ def parse_options(argv: List[str]) ->dict:
             return options
         elif opt in ('-v', '--verbose'):
             options['verbose'] = True 
+        elif opt in ('-s', '--shard'):
+            try:
+                options['shard'] = parse_shard(arg)
+            except ValueError as e:
+                print(e)
+                options['showUsage'] = True 
+                options['message'] = 2 
+                return options
+        elif opt in ('-t', '--threads'):
+            if not arg.isdigit() or int(arg) < 1:
+                options['showUsage'] = True 
+                options['message'] = 2 
+                return options
+            options['threads'] = int(arg)
     options['args'] = args
     return options
 
@@ -77,8 +98,11 @@ def main(argv: List[str]):
     files = []
     bags = []
     rest = []
-    get_md5_files(files, bags, rest, [ Path(arg) for arg in args ], arg_dict, verbose)
+    paths = select_shard([ Path(arg) for arg in args ], arg_dict['shard'], lambda path: path.is_dir() and not BAG_PATTERN.match(path.name))
+    get_md5_files(files, bags, rest, paths, arg_dict, verbose)
     stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    if arg_dict['shard'] is not None:
+        stamp = f'{stamp}_{shard_name(arg_dict["shard"])}'
     if len(files) > 0:
         write_csv_file(files, stamp, verbose)
     if len(bags) > 0:
@@ -142,12 +166,10 @@ def find_md5_file(file_path: PosixPath) ->dict:
     return result
 
 def get_md5_files(files: List[dict], bags: List[PosixPath], rest: List[PosixPath], paths: List[PosixPath], options: dict, verbose: bool):
-    """Get a list of files from input arguments
+    """Get a list of files from input arguments, directories are listed concurrently
     """
-    for file_path in paths:
-        if file_path.is_dir() and not re.match('^.*s-([a-z0-9]{1,}-)*bag$', file_path.name):
-            get_md5_files(files, bags, rest, list(file_path.glob('*')), options, verbose)
-        elif re.match('^.*s-([a-z0-9]{1,}-)*bag$', file_path.name):
+    for file_path in scan_paths(paths, lambda path: not BAG_PATTERN.match(path.name), options.get('threads', DEFAULT_THREADS)):
+        if BAG_PATTERN.match(file_path.name):
             bags.append(file_path)
         elif file_path.suffix in EXTENSIONS:
             result = find_md5_file(file_path)
@@ -14,20 +14,50 @@
 #
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/> 1}}}
-import getopt
-import json
+from itertools import islice, product
+import marshal
 import os
 from pathlib import Path, PosixPath
 import re
 import sys
 from urllib import parse
-from typing import List
 
 # my modules
 from result import Result
 from rule import Rule
+from vocabulary import Index
 
 DEBUG = False 
+TRANSLITERATION = str.maketrans({ 'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss', 'à': 'a', 'á': 'a', 'è': 'e', 'é': 'e', 'ê': 'e', 'ç': 'c' })
+
+def read_standard(json_file, cache: bool = False) ->dict:
+    """Return the data of the json file of a standard.
+
+    With cache, the data is kept with marshal in __pycache__ next to json_file and
+    read from there while json_file is unchanged, so json is not imported and parsed.
+    """
+    stat = os.stat(json_file)
+    cache_file = os.path.join(os.path.dirname(json_file), '__pycache__', os.path.basename(json_file) + '.marshal')
+    if cache:
+        try:
+            with open(cache_file, 'rb') as f:
+                mtime, size, data = marshal.load(f)
+            if mtime == stat.st_mtime_ns and size == stat.st_size:
+                return data
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+    import json
+    with open(json_file, encoding='utf-8') as json_ref:
+        data = json.load(json_ref)
+    if cache:
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(f'{cache_file}.{os.getpid()}', 'wb') as f:
+                marshal.dump((stat.st_mtime_ns, stat.st_size, data), f)
+            os.replace(f'{cache_file}.{os.getpid()}', cache_file)
+        except OSError:
+            pass
+    return data
 
 class MediaStandard:
     """This class represents a certain version of the mediastandard
@@ -38,9 +68,11 @@ class MediaStandard:
         self.rules = []
         self.comments = []
         self.mapping = { 'text': self.parse_title, 'ids': self.parse_ids, 'suffix': self.parse_suffix, 'suffix1': self.parse_v2_suffix, 'suffixExt': self.parse_suffix }
+        self.checks = { 'ids': self.check_ids, 'suffix': self.check_suffix, 'suffix1': self.check_v2_suffix, 'suffixExt': self.check_suffix }
         self.include_dirs_pattern = None
+        self.index = Index({})
 
-    def check_filename(self, path: PosixPath) ->Result: 
+    def check_filename(self, path: PosixPath | str) ->Result: 
         """Check if filename conforms to rules
         """
         result = None
@@ -48,9 +80,9 @@ class MediaStandard:
             result = rule.applies(path) 
             if not result.check_passed:
                 return result
-        m = self.pattern.match(path.name)
+        m = self.pattern.match(path.name if type(path) is PosixPath else os.path.basename(path))
         if m is not None:
-            result = Result(path, True, '',m.groupdict())
+            result = Result(path, True, '', match=m)
         else:
             result = Result(path, False, 'Pattern does not match')
         return result
@@ -65,22 +97,28 @@ class MediaStandard:
         for index, rule in enumerate(self.rules):
             print(f'{index+1})\t{rule}')
 
-    def get_content(self, result: Result) ->dict:
+    def get_content(self, result: Result, fields: list[str] = None) ->dict:
         """Return a dict with all the information.
+
+        If fields is given, only the groups in fields are decoded ('area' is decoded from 'areaCategory'),
+        all other groups are only checked (see check_group), so the verdict does not depend on fields.
         """
         information = {}
         if result is None or result.groups is None:
             raise Exception(f'Pattern does not match!')
-        information['filename'] = result.filename.name
+        information['filename'] = result.name
         for key in result.groups.keys():
+            if fields is not None and key not in fields and not (key == 'areaCategory' and 'area' in fields):
+                self.check_group(key, result.groups[key])
+                continue
             label = self.vocabulary[key] if key in self.vocabulary.keys() else key
             if key in self.content.keys():
                 combinedCategory = None
                 if not result.groups[key] in self.content[key].keys():
-                    if result.groups[key][0] in self.content.keys() and result.groups[key][1] in self.content[result.groups[key][0]].keys() and result.groups[key][2] in self.content[result.groups[key][0]].keys():
+                    if self.is_combined_category(result.groups[key]):
                         combinedCategory = { "key": result.groups[key][0], "parent": key }
                     else:
-                        raise Exception(f'{result.groups[key]} not in "{label}"')
+                        raise Exception(f'{result.groups[key]} not in "{label}"{self.did_you_mean(key, result.groups[key])}')
                 if key == 'areaCategory' and result.groups[key][0] in self.content['area'].keys():
                     information['area'] = { "label": "Bereich", "text": self.content["area"][result.groups[key][0]] } 
                     if combinedCategory is not None:
@@ -102,6 +140,55 @@ class MediaStandard:
                         information[key] = { "label": self.vocabulary[key], "text": result.groups[key] }
         return information
 
+    def check_group(self, key: str, value: str):
+        """Check a group without decoding it, raise the same exceptions as get_content
+        """
+        if key in self.content.keys():
+            if value not in self.content[key].keys() and not self.is_combined_category(value):
+                label = self.vocabulary[key] if key in self.vocabulary.keys() else key
+                raise Exception(f'{value} not in "{label}"{self.did_you_mean(key, value)}')
+        elif key in self.vocabulary.keys() and value is not None and key in self.checks.keys():
+            self.checks[key](value)
+
+    def check_ids(self, ids: str):
+        """Check the prefixes of ids like parse_ids
+        """
+        for id in [ id.replace('_','') for id in ids.split('-') ]:
+            if id[0] not in self.vocabulary.keys() and not re.match('[0-9]', id[0]):
+                raise Exception(f'{id[0]} is not a valid prefix for ID reference')
+
+    def check_suffix(self, suffix: str):
+        """Check the tokens of a suffix like parse_suffix
+        """
+        for s in suffix.replace('_s-', '').split('-'):
+            if s not in self.content['suffixType'].keys() and not re.match('\\d{3}', s):
+                raise Exception(f'{s} is not a valid suffix{self.did_you_mean("suffixType", s)}')
+
+    def check_v2_suffix(self, rawSuffix: str):
+        """Check a suffix like parse_v2_suffix
+        """
+        suffix = rawSuffix.replace('_', '')
+        if re.match(r'^[^0-9]\d{2}', suffix) and suffix[0] not in self.content['suffixType'].keys():
+            raise Exception(f'{suffix[0]} is not a valid suffix')
+
+    def did_you_mean(self, key: str, token: str) ->str:
+        """Return a hint with the keys of content table key that are close to token
+        """
+        suggestions = self.index[key].suggest(token) if key in self.index else []
+        return f', did you mean {" or ".join(suggestions)}?' if len(suggestions) > 0 else ''
+
+    def get_fields(self) ->list[str]:
+        """Return the names of all fields that get_content can decode.
+        """
+        fields = []
+        for key in self.pattern.groupindex.keys():
+            if key not in self.content.keys() and key not in self.vocabulary.keys():
+                continue
+            if key == 'areaCategory' and 'area' in self.content.keys():
+                fields.append('area')
+            fields.append(key)
+        return fields
+
     def match_dir_name(self, pathname) ->bool:
         """Check if dir as pathname should be included for validation
         """
@@ -109,23 +196,85 @@ class MediaStandard:
             return False
         return self.include_dirs_pattern.match(pathname)
 
-    def load(self, json_file) ->int:
-        """Load a specific standard
-        """
-        with open(json_file, encoding='utf-8') as json_ref:
-            data = json.load(json_ref)
-            self.version = data['info']['version']
-            self.year = data['info']['year']
-            self.comments = data['info']['comments']
-            self.pattern = re.compile(parse.unquote(data['pattern']))
-            self.content = data['content']
-            self.vocabulary = data['vocabulary']
-            if 'includeDirs' in data.keys():
-                self.include_dirs_pattern = re.compile(parse.unquote(data['includeDirs']))
-            for rule in data['rules']:
-                self.rules.append(Rule(rule))
+    def load(self, json_file, cache: bool = False) ->int:
+        """Load a specific standard (see read_standard for cache)
+        """
+        data = read_standard(json_file, cache)
+        self.version = data['info']['version']
+        self.year = data['info']['year']
+        self.comments = data['info']['comments']
+        self.pattern = re.compile(parse.unquote(data['pattern']))
+        self.content = data['content']
+        self.vocabulary = data['vocabulary']
+        if 'includeDirs' in data.keys():
+            self.include_dirs_pattern = re.compile(parse.unquote(data['includeDirs']))
+        for rule in data['rules']:
+            self.rules.append(Rule(rule))
+        self.index = Index(self.content)
         return 0
 
+    def is_combined_category(self, value: str) ->bool:
+        """Return true if value is a combination of a table key and two keys of that table (e.g. 'w1a')
+        """
+        return len(value) > 2 and value[0] in self.content.keys() and type(self.content[value[0]]) is dict\
+                and value[1] in self.content[value[0]].keys() and value[2] in self.content[value[0]].keys()
+
+    def is_valid(self, name: str) ->bool:
+        """Return true if name passes all rules and its content can be decoded
+        """
+        result = self.check_filename(name)
+        if not result.check_passed:
+            return False
+        try:
+            self.get_content(result)
+        except Exception:
+            return False
+        return True
+
+    def normalize_name(self, name: str) ->str:
+        """Return name without uppercase letters, umlauts, whitespace and dots before the extension
+        """
+        stem, dot, extension = name.rpartition('.')
+        if dot == '':
+            stem, extension = name, ''
+        stem = re.sub(r'\s+', '-', stem.strip().lower().translate(TRANSLITERATION)).replace('.', '-')
+        return stem + dot + extension.lower()
+
+    def suggest_filename(self, name: str, limit: int = 3) ->list[str]:
+        """Return up to limit valid names that are close to an invalid name.
+
+        The name is normalized (see normalize_name), tokens that are not in the content
+        tables are replaced by the nearest keys of their table (see Trie.suggest).
+        """
+        normalized = self.normalize_name(name)
+        if self.is_valid(normalized):
+            return [ normalized ] if normalized != name else []
+        m = self.pattern.match(normalized)
+        if m is None:
+            return []
+        options = []
+        for key, value in m.groupdict().items():
+            if value is None:
+                continue
+            if key in self.index and value not in self.content[key].keys() and not self.is_combined_category(value):
+                options.append((m.start(key), m.end(key), [ value ] + self.index[key].suggest(value)))
+            elif self.mapping.get(key) == self.parse_suffix:
+                start = m.start(key) + (len('_s-') if value.startswith('_s-') else 0)
+                for token in value[start-m.start(key):].split('-'):
+                    if token not in self.content['suffixType'].keys() and not re.match('\\d{3}', token):
+                        options.append((start, start + len(token), [ token ] + self.index['suffixType'].suggest(token)))
+                    start += len(token) + 1
+        suggestions = []
+        for replacements in islice(product(*[ option[2] for option in options ]), 64):
+            candidate = normalized
+            for option, replacement in reversed(list(zip(options, replacements))):
+                candidate = candidate[:option[0]] + replacement + candidate[option[1]:]
+            if candidate != name and candidate not in suggestions and self.is_valid(candidate):
+                suggestions.append(candidate)
+                if len(suggestions) >= limit:
+                    break
+        return suggestions
+
     def parse_title(self, title: str, label: str) ->dict:
         """Parses a title and returns an information dict.
         """
@@ -151,11 +300,14 @@ class MediaStandard:
         """Parses a suffix and returns an information dict.
         """
         contents = []
-        for s in [ s for s in suffix.replace('_s-', '').split('-') if not re.match('\\d{3}', s) ]:
-            if s in self.content['suffixType'].keys():
-                contents.append({"label": self.content['suffixType'][s]['label'], "text": self.content['suffixType'][s]['text']})
+        for s in suffix.replace('_s-', '').split('-'):
+            if re.match('\\d{3}', s):
+                continue
+            content = self.content['suffixType'].get(s)
+            if content is not None:
+                contents.append({"label": content['label'], "text": content['text']})
             else:
-                raise Exception(f'{s} is not a valid suffix')
+                raise Exception(f'{s} is not a valid suffix{self.did_you_mean("suffixType", s)}')
         m = re.match(r'^(_s-.*)(\d{3})(.*)', suffix)
         if m:
             contents.append({"label":"Seriennummer","text": m.groups()[1]})
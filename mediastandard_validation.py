@@ -16,7 +16,6 @@
 #
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/> 1}}}
-from colorama import Fore, Style
 from pathlib import Path, PosixPath
 import sys
 
@@ -29,9 +28,17 @@ class FancyPrinter(Printer):
     """This class represents a fancy output printer.
     """
     def __init__(self):
-        self.color_dict = { "default": Fore.LIGHTBLUE_EX, "comment": Fore.LIGHTWHITE_EX, "fail": Fore.RED, "highlight": Fore.MAGENTA, "reset": Style.RESET_ALL}
+        self._color_dict = None
+    @property
+    def color_dict(self) ->dict:
+        """Colors, colorama is only imported when they are used
+        """
+        if self._color_dict is None:
+            from colorama import Fore, Style
+            self._color_dict = { "default": Fore.LIGHTBLUE_EX, "comment": Fore.LIGHTWHITE_EX, "fail": Fore.RED, "highlight": Fore.MAGENTA, "reset": Style.RESET_ALL}
+        return self._color_dict
     def get_filename(self, file_path: PosixPath) ->str:
-        return Fore.LIGHTBLUE_EX + str(file_path.absolute()) + Style.RESET_ALL if file_path.exists() else Fore.LIGHTBLUE_EX + file_path.name + Style.RESET_ALL
+        return self.color_dict['default'] + str(file_path.absolute()) + self.color_dict['reset'] if file_path.exists() else self.color_dict['default'] + file_path.name + self.color_dict['reset']
 
 if __name__ == "__main__":
     sys.exit(main(sys.argv[1:], FancyPrinter()))
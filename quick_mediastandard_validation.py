@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""This program can be used to check filenames quickly, e.g. from git hooks or ingest scripts.
+"""
+#    Copyright (C) Christian Steiner 2026  {{{1
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/> 1}}}
+import sys
+
+# my modules
+from mediastandard import MediaStandard
+
+DEBUG = False 
+JSON = 'medienstandard_v3_regex.json'
+
+def parse_options(argv: list[str]) ->dict:
+    """
+
+    OPTIONS:
+        -h|--help       show help
+        -j|--json=file  json file
+        -p|--pattern    print regex pattern for mediastandard
+
+    Names are only checked as names, directories are not listed. With -, names are read
+    from stdin. Options may follow names, -- ends the options.
+
+    """
+    import getopt
+    options = { 'args': [], 'json': JSON, 'patternOnly': False, 'showUsage': False, 'message': 0 }
+    try:
+        opts, args = getopt.gnu_getopt(argv, "hj:p", ["help", "json=", "pattern"])
+    except getopt.GetoptError as e:
+        print(e, file=sys.stderr)
+        options['showUsage'] = True 
+        options['message'] = 2 
+        return options
+    for opt, arg in opts:
+        if opt in ('-h', '--help'):
+            options['showUsage'] = True 
+            return options
+        elif opt in ('-j', '--json'):
+            options['json'] = arg 
+        elif opt in ('-p', '--pattern'):
+            options['patternOnly'] = True 
+    options['args'] = args
+    return options
+
+def usage() ->int:
+    """prints information on how to use the script
+    """
+    print(main.__doc__)
+    print("\n\t" + sys.argv[0] + " [OPTIONS] name1 name2 ... | -")
+    print(parse_options.__doc__)
+    print("\t:return: exit code (int), 1 if a name fails")
+    return 0
+
+def check(checker: MediaStandard, name: str) ->str:
+    """Check a name, return the error message or '' if it passes
+    """
+    result = checker.check_filename(name)
+    if not result.check_passed:
+        return result.error_msg
+    try:
+        checker.get_content(result)
+    except Exception as e:
+        return str(e)
+    return ''
+
+def main(argv: list[str]) ->int:
+    """This program can be used to check filenames quickly, without listing directories or fancy output."""
+    arg_dict = parse_options(argv)
+    if arg_dict['showUsage']:
+        usage()
+        return arg_dict['message']
+    names = []
+    for arg in arg_dict['args']:
+        if arg == '-':
+            names += [ line.rstrip('\n') for line in sys.stdin if line.strip() != '' ]
+        else:
+            names.append(arg)
+    checker = MediaStandard()
+    checker.load(arg_dict['json'], cache=True)
+    if arg_dict['patternOnly']:
+        checker.display_rules_pattern()
+        return 0
+    failed = 0
+    for name in names:
+        error_msg = check(checker, name)
+        if error_msg:
+            failed += 1
+            print(f'{name}\t[FAIL]:\t{error_msg}')
+        else:
+            print(f'{name}\t[OK]')
+    return 1 if failed > 0 else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
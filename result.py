@@ -15,43 +15,108 @@
 #
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/> 1}}}
-from dataclasses import dataclass
 import os
 from pathlib import Path, PosixPath
 import re
+import sys
 
 DEBUG = False 
 
-@dataclass
+MESSAGES: list[str] = [ '' ]
+MESSAGE_CODES = { '': 0 }
+
+def message_code(message: str) ->int:
+    """Return the error code of an (interned) error message
+    """
+    message = str(message)
+    code = MESSAGE_CODES.get(message)
+    if code is None:
+        code = len(MESSAGES)
+        MESSAGES.append(sys.intern(message))
+        MESSAGE_CODES[MESSAGES[code]] = code
+    return code
+
+def message_text(code: int) ->str:
+    """Return the error message for an error code
+    """
+    return MESSAGES[code]
+
 class Result:
     """This class represents the result of the Mediastandard check
+
+    The path is kept as a string and the groups as the re.Match they
+    come from, both are only materialised when they are accessed.
     """
-    def __init__(self, filename: PosixPath, check_passed=True, error_msg="", groups=None): 
-        self.filename = filename
+    __slots__ = ('path', 'check_passed', 'error_code', 'message_codes', '_match', '_groups')
+
+    def __init__(self, filename: PosixPath | str, check_passed=True, error_msg="", groups=None, match: re.Match = None): 
+        self.path = os.fspath(filename)
         self.check_passed = check_passed
-        self.error_msg = error_msg
-        self.groups = groups
+        self.error_code = message_code(error_msg)
+        self.message_codes = ()
+        self._groups = groups
+        self._match = match
+
+    @property
+    def filename(self) ->PosixPath:
+        return Path(self.path)
+
+    @filename.setter
+    def filename(self, filename: PosixPath | str):
+        self.path = os.fspath(filename)
+
+    @property
+    def name(self) ->str:
+        return os.path.basename(self.path)
+
+    @property
+    def groups(self) ->dict:
+        if self._groups is None and self._match is not None:
+            self._groups = self._match.groupdict()
+            self._match = None
+        return self._groups
+
+    @groups.setter
+    def groups(self, groups: dict):
+        self._groups = groups
+        self._match = None
+
+    @property
+    def error_msg(self) ->str:
+        error_msg = MESSAGES[self.error_code]
+        for code in self.message_codes:
+            if ":" in error_msg:
+                error_msg = error_msg + " " + MESSAGES[code]
+            else:
+                error_msg = error_msg + ": " + MESSAGES[code]
+        return error_msg
+
+    @error_msg.setter
+    def error_msg(self, error_msg: str):
+        self.error_code = message_code(error_msg)
+        self.message_codes = ()
 
     def addMessage(self, message: str, m: re.Match):
         """Adds a error message
         """
-        if len(m.groupdict()):
-            self.groups = m.groupdict()
-        if ":" in self.error_msg:
-            self.error_msg = self.error_msg + " " + message
-        else:
-            self.error_msg = self.error_msg + ": " + message
+        if m.re.groupindex:
+            self._match = m
+            self._groups = None
+        self.message_codes = self.message_codes + (message_code(message),)
 
     def getFilenameInfo(self, color_dict: dict) ->str:
         """Get graphical information about filename
         """
-        if self.filename.exists():
-            if not self.check_passed and self.groups:
-                return color_dict['default'] + f'{self.filename.parent.absolute()}{os.sep}{self.groups["before"]}' + color_dict['fail'] + f'{self.groups["error"]}' + color_dict['reset'] + color_dict['default'] + f'{self.groups["after"]}' + color_dict['reset']
-            return color_dict['default'] + f'{self.filename.absolute()}' + color_dict['reset']
+        file_path = self.filename
+        groups = self.groups
+        if file_path.exists():
+            if not self.check_passed and groups:
+                return color_dict['default'] + f'{file_path.parent.absolute()}{os.sep}{groups["before"]}' + color_dict['fail'] + f'{groups["error"]}' + color_dict['reset'] + color_dict['default'] + f'{groups["after"]}' + color_dict['reset']
+            return color_dict['default'] + f'{file_path.absolute()}' + color_dict['reset']
         else:
-            if not self.check_passed and self.groups:
-                return color_dict['default'] + f'{self.groups["before"]}' + color_dict['fail'] + f'{self.groups["error"]}' + color_dict['reset'] + color_dict['default'] + f'{self.groups["after"]}' + color_dict['reset']
-            return color_dict['default'] + f'{self.filename.name}' + color_dict['reset']
-
+            if not self.check_passed and groups:
+                return color_dict['default'] + f'{groups["before"]}' + color_dict['fail'] + f'{groups["error"]}' + color_dict['reset'] + color_dict['default'] + f'{groups["after"]}' + color_dict['reset']
+            return color_dict['default'] + f'{file_path.name}' + color_dict['reset']
 
+    def __repr__(self):
+        return f'Result(filename={self.path!r}, check_passed={self.check_passed!r}, error_msg={self.error_msg!r}, groups={self.groups!r})'
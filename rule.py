@@ -15,8 +15,9 @@
 #
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/> 1}}}
+import os
 import re
-from pathlib import Path, PosixPath
+from pathlib import PosixPath
 from urllib import parse
 
 # my module
@@ -38,12 +39,12 @@ class Rule:
     def applies(self, filename: PosixPath | str) ->Result:
         """Check if rule applies, return Result
         """
-        file_path = filename if type(filename) is PosixPath else Path(filename)
-        if self.pattern.match(file_path.name):
-            return Result(file_path)
-        errorResult = Result(file_path, False, self.error)
+        name = filename.name if type(filename) is PosixPath else os.path.basename(filename)
+        if self.pattern.match(name):
+            return Result(filename)
+        errorResult = Result(filename, False, self.error)
         for onErrorRule in self.onErrorRules:
-            m = onErrorRule.findError(file_path.name)
+            m = onErrorRule.findError(name)
             if m:
                 errorResult.addMessage(onErrorRule.error, m)
         return errorResult
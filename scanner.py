@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#    Copyright (C) Christian Steiner 2026  {{{1
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/> 1}}}
+import os
+from pathlib import Path, PosixPath
+from typing import Callable, Iterator, List, Tuple
+
+DEBUG = False 
+DEFAULT_THREADS = 16
+
+def list_directory(executor: 'ThreadPoolExecutor', dir_path: PosixPath, descend: Callable[[PosixPath], bool]) ->List[Tuple[PosixPath, 'Future']]:
+    """List a directory and submit the listing of all subdirectories to descend into.
+
+    Returns the entries as (path, future), future is None if path is not descended into.
+    """
+    entries = []
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                path = Path(entry.path)
+                if entry.is_dir() and descend(path):
+                    entries.append((path, executor.submit(list_directory, executor, path, descend)))
+                else:
+                    entries.append((path, None))
+    except OSError as e:
+        if DEBUG:
+            print(f'Error listing {dir_path}: {e}')
+    return entries
+
+def list_root(executor: 'ThreadPoolExecutor', path: PosixPath, descend: Callable[[PosixPath], bool]) ->List[Tuple[PosixPath, 'Future']]:
+    """List a root argument: a directory to descend into or a single path
+    """
+    if path.is_dir() and descend(path):
+        return list_directory(executor, path, descend)
+    return [ (path, None) ]
+
+def scan_paths(paths: List[PosixPath], descend: Callable[[PosixPath], bool] = None, threads: int = DEFAULT_THREADS, ordered: bool = True) ->Iterator[PosixPath]:
+    """Yield all paths below paths that are not descended into.
+
+    Directories are listed concurrently by a pool of threads, across subtrees and
+    root paths. If ordered is true, the paths are yielded in the depth-first order
+    of a sequential walk, else as soon as their directory has been listed.
+    Directories are descended into if descend(path) is true (default: always).
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+    if descend is None:
+        descend = lambda path: True
+    executor = ThreadPoolExecutor(max_workers=threads)
+    try:
+        futures = [ executor.submit(list_root, executor, path, descend) for path in paths ]
+        if ordered:
+            stack = [ iter([ (None, future) for future in futures ]) ]
+            while len(stack) > 0:
+                entry = next(stack[-1], None)
+                if entry is None:
+                    stack.pop()
+                elif entry[1] is None:
+                    yield entry[0]
+                else:
+                    stack.append(iter(entry[1].result()))
+        else:
+            pending = set(futures)
+            while len(pending) > 0:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for path, child in future.result():
+                        if child is None:
+                            yield path
+                        else:
+                            pending.add(child)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""This program can be used to merge the partial outputs of sharded runs (--shard i/N) into one report.
+"""
+#    Copyright (C) Christian Steiner 2026  {{{1
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/> 1}}}
+from collections import Counter
+import csv
+import getopt
+import heapq
+import json
+from pathlib import Path, PosixPath
+import sys
+import tempfile
+from typing import Callable, Iterator, List, Tuple
+import zlib
+
+DEBUG = False 
+NDJSON_SUFFIXES = [ '.ndjson', '.jsonl' ]
+CHUNK_SIZE = 500000
+SUMMARY = 'SUMMARY'
+SUMMARY_KEYS = [ 'total', 'OK', 'FAIL' ]
+
+def parse_shard(shard: str) ->Tuple[int, int]:
+    """Parse a shard argument 'i/N' (1 <= i <= N) and return (i, N)
+    """
+    try:
+        index, count = [ int(value) for value in shard.split('/') ]
+    except ValueError:
+        raise ValueError(f'{shard} is not a valid shard, use i/N')
+    if count < 1 or index < 1 or index > count:
+        raise ValueError(f'{shard} is not a valid shard, use i/N with 1 <= i <= N')
+    return index, count
+
+def in_shard(key: str, shard: Tuple[int, int]) ->bool:
+    """Return true if key belongs to shard.
+
+    The hash is independent of the host and the python process, so all nodes agree.
+    """
+    index, count = shard
+    return zlib.crc32(key.encode('utf-8', 'surrogateescape')) % count == index - 1
+
+def select_shard(paths: List[PosixPath], shard: Tuple[int, int], is_tree: Callable[[PosixPath], bool]) ->List[PosixPath]:
+    """Return the part of paths that belongs to shard.
+
+    Trees (see is_tree) are split into their top-level entries, which are assigned
+    to a shard by their name; all other paths are assigned by their path.
+    """
+    if shard is None:
+        return paths
+    selected = []
+    for path in paths:
+        if is_tree(path):
+            selected += [ child for child in sorted(path.glob('*')) if in_shard(child.name, shard) ]
+        elif in_shard(str(path), shard):
+            selected.append(path)
+    return selected
+
+def shard_name(shard: Tuple[int, int]) ->str:
+    """Return a name for shard that can be used in filenames
+    """
+    return f'shard-{shard[0]}-of-{shard[1]}'
+
+def read_records(file_path: PosixPath) ->Iterator[dict]:
+    """Yield the records of a partial output
+    """
+    with file_path.open(encoding='utf-8', newline='') as f:
+        if file_path.suffix in NDJSON_SUFFIXES:
+            for line in f:
+                if line.strip() != '':
+                    yield json.loads(line)
+        elif file_path.suffix == '.csv':
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip() != '':
+                    yield { 'line': line.rstrip('\n') }
+
+def count_record(counters: Counter, record: dict):
+    """Add a record to the summary counters
+    """
+    counters['total'] += 1
+    if 'status' in record.keys():
+        counters[record['status']] += 1
+    if 'md5' in record.keys():
+        counters['md5' if record['md5'] else 'no md5'] += 1
+
+def summary_record(counters: Counter, csv_format: bool = False) ->dict:
+    """Return the record of the summary counters (total, OK, FAIL) of a partial output.
+
+    In csv, the counters are stored as json in the error field.
+    """
+    summary = { key: counters[key] for key in SUMMARY_KEYS }
+    if csv_format:
+        return { 'status': SUMMARY, 'error': json.dumps(summary) }
+    return { 'status': SUMMARY, 'summary': summary }
+
+def read_summary(record: dict) ->Counter:
+    """Return the summary counters of a summary record or None
+    """
+    if record.get('status') != SUMMARY:
+        return None
+    return Counter(record['summary'] if 'summary' in record.keys() else json.loads(record['error']))
+
+def spill(records: List[dict], run: PosixPath) ->PosixPath:
+    """Write sorted records to the temporary ndjson file run
+    """
+    with run.open('w', encoding='utf-8') as f:
+        f.writelines(json.dumps(record) + '\n' for record in records)
+    return run
+
+def merge(file_paths: List[PosixPath], output, chunk_size: int = CHUNK_SIZE) ->Counter:
+    """Merge partial outputs of the same format into output, sorted by their first field, and return the summary counters.
+
+    If the parts end with summary records (see summary_record), their counters are summed,
+    written as the last record of output and returned instead of the counts of the
+    records, which may only be the fails. Records are sorted in chunks of chunk_size, spilled to temporary files and merged
+    with heapq.merge (like snapshot.SnapshotWriter), so the parts are never held in memory.
+    """
+    fieldnames = {}
+    chunk = []
+    runs = []
+    summaries = []
+    sort_key = lambda record: str(record.get(next(iter(fieldnames)), ''))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for file_path in file_paths:
+            for record in read_records(file_path):
+                summary = read_summary(record)
+                if summary is not None:
+                    summaries.append(summary)
+                    continue
+                fieldnames.update(dict.fromkeys(record.keys()))
+                chunk.append(record)
+                if len(chunk) >= chunk_size:
+                    chunk.sort(key=sort_key)
+                    runs.append(spill(chunk, Path(tmp_dir) / f'run{len(runs)}.ndjson'))
+                    chunk = []
+        chunk.sort(key=sort_key)
+        streams = [ read_records(run) for run in runs ] + [ iter(chunk) ]
+        suffix = file_paths[0].suffix if len(file_paths) > 0 else ''
+        writer = None
+        if suffix == '.csv':
+            writer = csv.DictWriter(output, fieldnames=list(fieldnames))
+            writer.writeheader()
+        counters = Counter()
+        for record in heapq.merge(*streams, key=sort_key):
+            count_record(counters, record)
+            if suffix in NDJSON_SUFFIXES:
+                output.write(json.dumps(record, ensure_ascii=False) + '\n')
+            elif writer is not None:
+                writer.writerow(record)
+            else:
+                output.write(record['line'] + '\n')
+    if len(summaries) > 0:
+        summary = sum(summaries, Counter())
+        if suffix in NDJSON_SUFFIXES:
+            output.write(json.dumps(summary_record(summary)) + '\n')
+        elif writer is not None:
+            writer.writerow(summary_record(summary, csv_format=True))
+        for key in SUMMARY_KEYS:
+            counters[key] = summary[key]
+    return counters
+
+def parse_options(argv: List[str]) ->dict:
+    """
+
+    OPTIONS:
+        -h|--help           show help
+        -o|--output=file    write merged output to file (default: stdout)
+
+    """
+    options = { 'args': [], 'output': None, 'showUsage': False, 'message': 0 }
+    try:
+        opts, args = getopt.getopt(argv, "ho:", ["help", "output="])
+    except getopt.GetoptError:
+        options['showUsage'] = True 
+        options['message'] = 2 
+        return options
+    for opt, arg in opts:
+        if opt in ('-h', '--help'):
+            options['showUsage'] = True 
+            return options
+        elif opt in ('-o', '--output'):
+            options['output'] = arg 
+    options['args'] = args
+    return options
+
+def usage() ->int:
+    """prints information on how to use the script
+    """
+    print(main.__doc__)
+    print("\n\t" + sys.argv[0] + " [OPTIONS] part1 part2 ...")
+    print(parse_options.__doc__)
+    print("\t:return: exit code (int)")
+    return 0
+
+def main(argv: List[str]):
+    """This program can be used to merge the partial outputs (ndjson, csv or path lists) of sharded runs into one report."""
+    arg_dict = parse_options(argv)
+    if arg_dict['showUsage'] or len(arg_dict['args']) < 1:
+        usage()
+        return arg_dict['message']
+    file_paths = [ Path(arg) for arg in arg_dict['args'] ]
+    if len(set([ file_path.suffix if file_path.suffix in NDJSON_SUFFIXES + [ '.csv' ] else '' for file_path in file_paths ])) > 1:
+        print('All partial outputs must have the same format!', file=sys.stderr)
+        return 2
+    if arg_dict['output'] is not None:
+        with open(arg_dict['output'], 'w', encoding='utf-8', newline='') as output:
+            counters = merge(file_paths, output)
+    else:
+        counters = merge(file_paths, sys.stdout)
+    print(f'Merged {len(file_paths)} part{"s" if len(file_paths) > 1 else ""}: ' + ', '.join([ f'{key}: {value}' for key, value in counters.items() ]), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
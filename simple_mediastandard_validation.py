@@ -16,6 +16,9 @@
 #
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/> 1}}}
+from collections import Counter
+from contextlib import nullcontext
+import csv
 import getopt
 import json
 import os
@@ -27,8 +30,10 @@ from typing import List
 
 # my modules
 from mediastandard import MediaStandard
+from scanner import DEFAULT_THREADS, scan_paths
 
 DEBUG = False 
+OUTPUT_FORMATS = [ 'text', 'ndjson', 'csv' ]
 
 class Printer:
     """This class represents a simple output printer.
@@ -48,6 +53,9 @@ class Printer:
             print(f'{filename}\t[' + self.color_dict['fail'] + 'FAIL' + self.color_dict['reset'] + f']:\t{error_msg}')
         else:
             print(f'{filename}\t[' + self.color_dict['fail'] + 'FAIL' + self.color_dict['reset'] + ']')
+    def print_suggestions(self, suggestions: List[str]):
+        for suggestion in suggestions:
+            print('\tVorschlag:\t' + self.color_dict['highlight'] + suggestion + self.color_dict['reset'])
     def print_information(self, filename: str, information: dict, verbose: bool):
         """Display the information
         """
@@ -61,20 +69,76 @@ class Printer:
         else:
             print(f'{filename}\t[OK]')
 
+class RecordWriter:
+    """This class represents a writer for machine readable output (ndjson or csv).
+    """
+    def __init__(self, output_format: str, fields: List[str], stream=None, suggest: bool = False): 
+        self.output_format = output_format
+        self.fields = fields
+        self.stream = stream if stream is not None else sys.stdout
+        self.suggest = suggest
+        self.writer = None
+        if output_format == 'csv':
+            self.writer = csv.DictWriter(self.stream, fieldnames=[ 'filename', 'status', 'error' ] + fields + ([ 'suggestions' ] if suggest else []))
+            self.writer.writeheader()
+    def get_record(self, filename: str, information: dict = None, error_msg: str = '', suggestions: List[str] = None) ->dict:
+        """Return a flat record with the requested fields
+        """
+        record = { 'filename': filename, 'status': 'FAIL' if error_msg else 'OK', 'error': error_msg }
+        for field in self.fields:
+            record[field] = self.get_value(field, information) if information is not None else None
+        if self.suggest:
+            record['suggestions'] = suggestions if suggestions is not None else []
+        return record
+    def get_value(self, field: str, information: dict) ->str | List[str]:
+        """Return the text of a field, or the texts of its contents
+        """
+        if field == 'area' and 'area' in information.keys():
+            return information['area']['text']
+        entry = information['area'] if field == 'areaCategory' and field not in information.keys() and 'area' in information.keys()\
+                else information.get(field)
+        if entry is None:
+            return None
+        if 'contents' in entry.keys():
+            return [ content['text'] for content in entry['contents'] ]
+        return entry['text']
+    def write(self, filename: str, information: dict = None, error_msg: str = '', suggestions: List[str] = None):
+        record = self.get_record(filename, information, str(error_msg), suggestions)
+        if self.writer is not None:
+            self.writer.writerow({ key: ';'.join(value) if type(value) is list else value for key, value in record.items() })
+        else:
+            self.stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+    def write_summary(self, counters: Counter):
+        """Write the summary counters as last record of a partial output (see shard.merge)
+        """
+        from shard import summary_record
+        record = summary_record(counters, self.writer is not None)
+        if self.writer is not None:
+            self.writer.writerow(record)
+        else:
+            self.stream.write(json.dumps(record) + '\n')
+
 def parse_options(argv: List[str]) ->dict:
     """
 
     OPTIONS:
-        -f|--fail-only  show only fails
-        -h|--help       show help
-        -j|--json=file  json file
-        -p|--pattern    print regex pattern for mediastandard
-        -v|--verbose    print fileinfomation
+        -F|--fields=list    decode only these fields, e.g. owner,ids (see -p for names)
+        -f|--fail-only      show only fails
+        -h|--help           show help
+        -j|--json=file      json file
+        -o|--output=format  output format: text (default), ndjson or csv
+        -p|--pattern        print regex pattern for mediastandard
+        -S|--suggest        suggest valid names for failing names
+        -s|--shard=i/N      check only the i-th of N disjoint parts of the input
+        -t|--threads=n      number of threads listing directories concurrently (default: 16)
+        -v|--verbose        print fileinfomation
+        -w|--snapshot=file  write a snapshot of the results to file (see snapshot.py)
 
     """
-    options = { 'args': [], 'json': "medienstandard_v3_regex.json", 'verbose': False, 'failOnly': False, 'patternOnly': False, 'showUsage': False, 'message': 0 }
+    options = { 'args': [], 'json': "medienstandard_v3_regex.json", 'verbose': False, 'failOnly': False, 'patternOnly': False, 'showUsage': False, 'message': 0,\
+            'fields': None, 'output': 'text', 'shard': None, 'suggest': False, 'threads': DEFAULT_THREADS, 'snapshot': None }
     try:
-        opts, args = getopt.getopt(argv, "fhj:pv", ["fail-only", "help","json=", "pattern", "verbose"])
+        opts, args = getopt.getopt(argv, "F:fhj:o:pSs:t:vw:", ["fields=", "fail-only", "help","json=", "output=", "pattern", "suggest", "shard=", "threads=", "verbose", "snapshot="])
     except getopt.GetoptError:
         options['showUsage'] = True 
         options['message'] = 2 
@@ -89,8 +153,35 @@ def parse_options(argv: List[str]) ->dict:
             options['verbose'] = True 
         elif opt in ('-p', '--pattern'):
             options['patternOnly'] = True 
+        elif opt in ('-S', '--suggest'):
+            options['suggest'] = True 
         elif opt in ('-j', '--json'):
             options['json'] = arg 
+        elif opt in ('-w', '--snapshot'):
+            options['snapshot'] = arg 
+        elif opt in ('-F', '--fields'):
+            options['fields'] = [ field.strip() for field in arg.split(',') if field.strip() != '' ]
+        elif opt in ('-o', '--output'):
+            if arg not in OUTPUT_FORMATS:
+                options['showUsage'] = True 
+                options['message'] = 2 
+                return options
+            options['output'] = arg 
+        elif opt in ('-s', '--shard'):
+            from shard import parse_shard
+            try:
+                options['shard'] = parse_shard(arg)
+            except ValueError as e:
+                print(e)
+                options['showUsage'] = True 
+                options['message'] = 2 
+                return options
+        elif opt in ('-t', '--threads'):
+            if not arg.isdigit() or int(arg) < 1:
+                options['showUsage'] = True 
+                options['message'] = 2 
+                return options
+            options['threads'] = int(arg)
     options['args'] = args
     return options
 
@@ -112,35 +203,83 @@ def validate(printer: Printer, arg_dict: dict) ->int:
     verbose = arg_dict['verbose']
     patternOnly = arg_dict['patternOnly']
     failOnly = arg_dict['failOnly']
+    fields = arg_dict.get('fields')
+    output = arg_dict.get('output', 'text')
+    suggest = arg_dict.get('suggest', False)
+    messages = sys.stdout if output == 'text' else sys.stderr
     checker = MediaStandard()
     if checker.load(json) == 0:
-        printer.print_default(f"Medienstandard Version {checker.version}, {checker.year} geladen ...")
-        if verbose or patternOnly:
+        if output == 'text':
+            printer.print_default(f"Medienstandard Version {checker.version}, {checker.year} geladen ...")
+        if patternOnly:
+            printer.print_default(f'[Quelldatei: {json}]')
+            checker.display_rules_pattern()
+            printer.print_default(f'\nFields: {",".join(checker.get_fields())}')
+            return 0
+        if verbose and output == 'text':
             printer.print_default(f'[Quelldatei: {json}]')
-            if patternOnly:
-                checker.display_rules_pattern()
-                return 0
             for comment in checker.comments:
                 printer.print_comment(f'\n{comment}')
-    filenames = []
-    get_filenames(filenames, [ Path(arg) for arg in args ], checker, verbose)
-    printer.print_highlight(f'Checking {len(filenames)} filename{"s" if len(filenames) > 1 else ""}.')
-    if len(filenames) < 1:
-        print('Nothing to do ...')
-        return usage()
-    for file_path in filenames: 
-        result = checker.check_filename(file_path)
-        if not result.check_passed:
-            filename = result.getFilenameInfo(printer.color_dict)
-            printer.print_fail(filename, result.error_msg, verbose)
-        else:
-            filename = printer.get_filename(file_path) 
-            try: 
-                information = checker.get_content(result)
-                if not failOnly:
-                    printer.print_information(filename, information, verbose)
-            except Exception as e:
-                printer.print_fail(filename, e, verbose)
+        elif verbose:
+            print(f'[Quelldatei: {json}]', file=messages)
+    if fields is not None and len([ field for field in fields if field not in checker.get_fields() ]) > 0:
+        print(f'Unknown field(s): {",".join([ field for field in fields if field not in checker.get_fields() ])}, use one of {",".join(checker.get_fields())}', file=messages)
+        return 2
+    paths = [ Path(arg) for arg in args ]
+    if arg_dict.get('shard') is not None:
+        from shard import select_shard
+        paths = select_shard(paths, arg_dict['shard'], lambda path: path.is_dir() and not checker.match_dir_name(path.name))
+    filenames = get_filenames(paths, checker, verbose, arg_dict.get('threads', DEFAULT_THREADS), messages)
+    if output == 'text':
+        printer.print_highlight(f'Checking {len(filenames)} filename{"s" if len(filenames) > 1 else ""}.')
+    if len(filenames) < 1 and arg_dict.get('shard') is None:
+        print('Nothing to do ...', file=messages)
+        return usage() if output == 'text' else 0
+    writer = RecordWriter(output, fields if fields is not None else checker.get_fields(), suggest=suggest) if output != 'text' else None
+    snapshot = nullcontext()
+    if arg_dict.get('snapshot') is not None:
+        from snapshot import SnapshotWriter, VERDICT_CONTENT_ERROR, VERDICT_FAIL, VERDICT_OK
+        snapshot = SnapshotWriter(arg_dict['snapshot'])
+    counters = Counter()
+    with snapshot as snapshot:
+        for file_path in filenames: 
+            counters['total'] += 1
+            result = checker.check_filename(file_path)
+            if not result.check_passed:
+                counters['FAIL'] += 1
+                if snapshot is not None:
+                    snapshot.add(os.path.abspath(result.path), VERDICT_FAIL)
+                suggestions = checker.suggest_filename(file_path.name) if suggest else []
+                if writer is not None:
+                    writer.write(str(file_path), error_msg=result.error_msg, suggestions=suggestions)
+                    continue
+                filename = result.getFilenameInfo(printer.color_dict)
+                printer.print_fail(filename, result.error_msg, verbose)
+                printer.print_suggestions(suggestions)
+            else:
+                filename = printer.get_filename(file_path) if writer is None else str(file_path)
+                try: 
+                    information = checker.get_content(result, fields)
+                    counters['OK'] += 1
+                    if snapshot is not None:
+                        snapshot.add(os.path.abspath(result.path), VERDICT_OK, result.groups)
+                    if not failOnly:
+                        if writer is not None:
+                            writer.write(filename, information)
+                        else:
+                            printer.print_information(filename, information, verbose)
+                except Exception as e:
+                    counters['FAIL'] += 1
+                    if snapshot is not None:
+                        snapshot.add(os.path.abspath(result.path), VERDICT_CONTENT_ERROR, result.groups)
+                    suggestions = checker.suggest_filename(file_path.name) if suggest else []
+                    if writer is not None:
+                        writer.write(filename, error_msg=e, suggestions=suggestions)
+                    else:
+                        printer.print_fail(filename, e, verbose)
+                        printer.print_suggestions(suggestions)
+    if writer is not None and arg_dict.get('shard') is not None:
+        writer.write_summary(counters)
     return 0 
 
 def main(argv: List[str], printer: Printer):
@@ -151,16 +290,18 @@ def main(argv: List[str], printer: Printer):
         return arg_dict['message']
     return validate(printer, arg_dict) 
 
-def get_filenames(filenames: List[PosixPath], paths: List[PosixPath], checker: MediaStandard, verbose: bool) -> List[PosixPath]:
-    """Get a list of filenames from input arguments
+def get_filenames(paths: List[PosixPath], checker: MediaStandard = None, verbose: bool = False, threads: int = DEFAULT_THREADS, messages=None) -> List[PosixPath]:
+    """Get a list of filenames from input arguments, directories are listed concurrently.
+
+    Progress is printed to messages (default: stdout) if verbose.
     """
-    for file_path in paths:
-        if file_path.is_dir() and not checker.match_dir_name(file_path.name):
-            get_filenames(filenames, list(file_path.glob('*')), checker, verbose)
-        else:
-            filenames.append(file_path)
-            if verbose:
-                print(f'{len(filenames)} files added ...', end='\r')
+    filenames = []
+    descend = (lambda path: not checker.match_dir_name(path.name)) if checker is not None else None
+    for file_path in scan_paths(paths, descend, threads):
+        filenames.append(file_path)
+        if verbose:
+            print(f'{len(filenames)} files added ...', end='\r', file=messages if messages is not None else sys.stdout)
+    return filenames
 
 if __name__ == "__main__":
     sys.exit(main(sys.argv[1:], Printer()))
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""This program can be used to compare the snapshots of two validation runs (see option -w|--snapshot).
+"""
+#    Copyright (C) Christian Steiner 2026  {{{1
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/> 1}}}
+import bisect
+from collections import Counter
+from difflib import SequenceMatcher
+import getopt
+import gzip
+import hashlib
+import heapq
+import json
+import os
+from pathlib import Path, PosixPath
+import re
+import sys
+import tempfile
+from typing import Iterator, List, NamedTuple
+
+# my modules
+from mediastandard import TRANSLITERATION
+
+DEBUG = False 
+HEADER = '#mediastandard-snapshot 1'
+CHUNK_SIZE = 500000
+RENAME_RATIO = 0.6
+RENAME_LIMIT = 10000
+RENAME_CANDIDATES = 8
+VERDICT_OK = 0
+VERDICT_FAIL = 1
+VERDICT_CONTENT_ERROR = 2
+
+class Entry(NamedTuple):
+    """This class represents an entry of a snapshot.
+    """
+    key: str
+    dir_hash: str
+    dir_path: str
+    name: str
+    verdict: int
+    groups: str
+
+    @property
+    def path(self) ->str:
+        return os.path.join(self.dir_path, self.name)
+
+def path_hash(dir_path: str) ->str:
+    """Return a stable hash of a directory path
+    """
+    return hashlib.blake2b(dir_path.encode('utf-8', 'surrogateescape'), digest_size=8).hexdigest()
+
+class SnapshotWriter:
+    """This class represents a writer for a sorted, gzipped snapshot of the results of a run.
+
+    Each line is 'dir_hash<TAB>name<TAB>verdict<TAB>groups' (name and groups as json),
+    the directory of a hash is stored once in a line 'dir_hash<TAB><TAB>dir_path', which
+    sorts before its entries. Lines are sorted in memory in chunks of chunk_size, spilled
+    to temporary files and merged on close.
+    """
+    def __init__(self, file_path: PosixPath | str, chunk_size: int = CHUNK_SIZE): 
+        self.file_path = Path(file_path)
+        self.chunk_size = chunk_size
+        self.lines = []
+        self.dir_lines = set()
+        self.runs = []
+        self.tmp_dir = None
+
+    def add(self, path: PosixPath | str, verdict: int, groups: dict = None):
+        """Add the result for path
+        """
+        dir_path, name = os.path.split(os.fspath(path))
+        dir_hash = path_hash(dir_path)
+        self.dir_lines.add(f'{dir_hash}\t\t{json.dumps(dir_path)}')
+        self.lines.append(f'{dir_hash}\t{json.dumps(name)}\t{verdict}\t{json.dumps(groups, separators=(",", ":")) if groups else ""}')
+        if len(self.lines) >= self.chunk_size:
+            self.spill()
+
+    def spill(self):
+        """Write the sorted lines in memory to a temporary file
+        """
+        if self.tmp_dir is None:
+            self.tmp_dir = tempfile.TemporaryDirectory()
+        run = Path(self.tmp_dir.name) / f'run{len(self.runs)}'
+        with run.open('w', encoding='utf-8') as f:
+            f.writelines(line + '\n' for line in sorted(self.lines + list(self.dir_lines)))
+        self.runs.append(run)
+        self.lines = []
+        self.dir_lines = set()
+
+    def close(self):
+        """Merge all lines into the snapshot file
+        """
+        files = [ run.open(encoding='utf-8') for run in self.runs ]
+        try:
+            streams = [ (line.rstrip('\n') for line in f) for f in files ] + [ iter(sorted(self.lines + list(self.dir_lines))) ]
+            with gzip.open(self.file_path, 'wt', encoding='utf-8') as snapshot:
+                snapshot.write(HEADER + '\n')
+                previous = None
+                for line in heapq.merge(*streams):
+                    if line != previous:
+                        snapshot.write(line + '\n')
+                    previous = line
+        finally:
+            for f in files:
+                f.close()
+            if self.tmp_dir is not None:
+                self.tmp_dir.cleanup()
+        self.lines = []
+        self.dir_lines = set()
+        self.runs = []
+        self.tmp_dir = None
+
+    def discard(self):
+        """Remove the temporary files without writing the snapshot file
+        """
+        if self.tmp_dir is not None:
+            self.tmp_dir.cleanup()
+        self.lines = []
+        self.dir_lines = set()
+        self.runs = []
+        self.tmp_dir = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+def read_snapshot(file_path: PosixPath | str) ->Iterator[Entry]:
+    """Yield the entries of a snapshot in sorted order
+    """
+    with gzip.open(file_path, 'rt', encoding='utf-8') as snapshot:
+        if snapshot.readline().rstrip('\n') != HEADER:
+            raise Exception(f'{file_path} is not a snapshot')
+        dir_path = None
+        for line in snapshot:
+            dir_hash, name, rest = line.rstrip('\n').split('\t', 2)
+            if name == '':
+                dir_path = json.loads(rest)
+                continue
+            verdict, groups = rest.split('\t', 1)
+            yield Entry(f'{dir_hash}\t{name}', dir_hash, dir_path, json.loads(name), int(verdict), groups)
+
+def compare(old: Entry, new: Entry) ->dict:
+    """Return the change between two entries of the same path or None
+    """
+    if old.verdict == new.verdict and old.groups == new.groups:
+        return None
+    if old.verdict != VERDICT_OK and new.verdict == VERDICT_OK:
+        change = 'fixed'
+    elif old.verdict == VERDICT_OK and new.verdict != VERDICT_OK:
+        change = 'failed'
+    else:
+        change = 'changed'
+    return { 'change': change, 'path': new.path, 'verdict': new.verdict }
+
+def rename_key(name: str) ->str:
+    """Return the stem of name without case, umlauts and separators, renames that only normalize a name keep it
+    """
+    return re.sub(r'[\s._-]+', '', os.path.splitext(name)[0].lower().translate(TRANSLITERATION))
+
+def neighbours(stems: List[str], new_stems: List[str]) ->Iterator[tuple]:
+    """Yield (i, j) for the RENAME_CANDIDATES new_stems[j] next to each stems[i] in sorted order
+    """
+    order = sorted(range(len(new_stems)), key=lambda j: new_stems[j])
+    sorted_stems = [ new_stems[j] for j in order ]
+    for i, stem in enumerate(stems):
+        start = max(0, bisect.bisect_left(sorted_stems, stem) - RENAME_CANDIDATES // 2)
+        for j in order[start:start+RENAME_CANDIDATES]:
+            yield (i, j)
+
+def similar_pairs(stems: List[str], new_stems: List[str]) ->List[tuple]:
+    """Return (ratio, i, j) for the stems[i] and new_stems[j] to compare, most similar first.
+
+    If there are more than RENAME_LIMIT pairs, each stem is only compared with the
+    RENAME_CANDIDATES new stems next to it in sorted order and in the sorted order
+    of the reversed stems, so a changed end or a changed beginning is found.
+    """
+    if len(stems) * len(new_stems) <= RENAME_LIMIT:
+        candidates = [ (i, j) for i in range(len(stems)) for j in range(len(new_stems)) ]
+    else:
+        candidates = set(neighbours(stems, new_stems))
+        candidates.update(neighbours([ stem[::-1] for stem in stems ], [ stem[::-1] for stem in new_stems ]))
+    return sorted([ (SequenceMatcher(None, stems[i], new_stems[j]).ratio(), i, j) for i, j in candidates ], reverse=True)
+
+def pair_renames(removed: List[Entry], added: List[Entry]) ->Iterator[dict]:
+    """Yield the changes of the removed and added entries of a directory, pairing renames.
+
+    Names with the same rename_key are paired first, the rest by the similarity of their stems.
+    """
+    renamed = {}
+    keys = {}
+    for j, new in enumerate(added):
+        keys.setdefault(rename_key(new.name), []).append(j)
+    for i, old in enumerate(removed):
+        candidates = keys.get(rename_key(old.name))
+        if candidates:
+            renamed[i] = candidates.pop(0)
+    paired = set(renamed.values())
+    left_removed = [ i for i in range(len(removed)) if i not in renamed.keys() ]
+    left_added = [ j for j in range(len(added)) if j not in paired ]
+    stems = [ os.path.splitext(removed[i].name.lower())[0] for i in left_removed ]
+    new_stems = [ os.path.splitext(added[j].name.lower())[0] for j in left_added ]
+    for ratio, i, j in similar_pairs(stems, new_stems):
+        if ratio < RENAME_RATIO:
+            break
+        if left_removed[i] not in renamed.keys() and left_added[j] not in paired:
+            renamed[left_removed[i]] = left_added[j]
+            paired.add(left_added[j])
+    for i, old in enumerate(removed):
+        if i in renamed.keys():
+            new = added[renamed[i]]
+            yield { 'change': 'renamed', 'path': old.path, 'new_path': new.path, 'verdict': new.verdict, 'old_verdict': old.verdict }
+        else:
+            yield { 'change': 'deleted', 'path': old.path, 'verdict': old.verdict }
+    for j, new in enumerate(added):
+        if j not in paired:
+            yield { 'change': 'added', 'path': new.path, 'verdict': new.verdict }
+
+def diff_snapshots(old_path: PosixPath | str, new_path: PosixPath | str) ->Iterator[dict]:
+    """Merge-join two snapshots and yield their changes.
+
+    Only the removed and added entries of the current directory are kept in memory.
+    """
+    old_entries = read_snapshot(old_path)
+    new_entries = read_snapshot(new_path)
+    old = next(old_entries, None)
+    new = next(new_entries, None)
+    removed = []
+    added = []
+    current = None
+    while old is not None or new is not None:
+        entry = old if new is None or (old is not None and old.key <= new.key) else new
+        if entry.dir_hash != current:
+            yield from pair_renames(removed, added)
+            removed = []
+            added = []
+            current = entry.dir_hash
+        if old is not None and new is not None and old.key == new.key:
+            change = compare(old, new)
+            if change is not None:
+                yield change
+            old = next(old_entries, None)
+            new = next(new_entries, None)
+        elif entry is old:
+            removed.append(old)
+            old = next(old_entries, None)
+        else:
+            added.append(new)
+            new = next(new_entries, None)
+    yield from pair_renames(removed, added)
+
+def parse_options(argv: List[str]) ->dict:
+    """
+
+    OPTIONS:
+        -h|--help           show help
+        -o|--output=file    write the changes as ndjson to file (default: stdout)
+
+    """
+    options = { 'args': [], 'output': None, 'showUsage': False, 'message': 0 }
+    try:
+        opts, args = getopt.getopt(argv, "ho:", ["help", "output="])
+    except getopt.GetoptError:
+        options['showUsage'] = True 
+        options['message'] = 2 
+        return options
+    for opt, arg in opts:
+        if opt in ('-h', '--help'):
+            options['showUsage'] = True 
+            return options
+        elif opt in ('-o', '--output'):
+            options['output'] = arg 
+    options['args'] = args
+    return options
+
+def usage() ->int:
+    """prints information on how to use the script
+    """
+    print(main.__doc__)
+    print("\n\t" + sys.argv[0] + " [OPTIONS] old_snapshot new_snapshot")
+    print(parse_options.__doc__)
+    print("\t:return: exit code (int)")
+    return 0
+
+def write_changes(old_path: PosixPath, new_path: PosixPath, output) ->Counter:
+    """Write the changes between two snapshots as ndjson to output and return the summary counters
+    """
+    counters = Counter()
+    for change in diff_snapshots(old_path, new_path):
+        counters[change['change']] += 1
+        output.write(json.dumps(change, ensure_ascii=False) + '\n')
+    return counters
+
+def main(argv: List[str]):
+    """This program can be used to list the new failures, fixed, renamed, added and deleted files between two snapshots."""
+    arg_dict = parse_options(argv)
+    if arg_dict['showUsage'] or len(arg_dict['args']) != 2:
+        usage()
+        return arg_dict['message'] if arg_dict['showUsage'] else 2
+    old_path, new_path = [ Path(arg) for arg in arg_dict['args'] ]
+    if arg_dict['output'] is not None:
+        with open(arg_dict['output'], 'w', encoding='utf-8') as output:
+            counters = write_changes(old_path, new_path, output)
+    else:
+        counters = write_changes(old_path, new_path, sys.stdout)
+    print('Changes: ' + ', '.join([ f'{key}: {value}' for key, value in counters.items() ]), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -29,6 +29,28 @@ class TestMediastandard(unittest.TestCase):
         information = self.checker.get_content(result)
         print(information)
 
+    def test_get_content_fields(self):
+        result = self.checker.check_filename(Path('kw1a_v007004_2022-05-20_museumsnacht-2022_s-031.jpg'))
+        information = self.checker.get_content(result, ['owner', 'ids'])
+        self.assertEqual(list(information.keys()), ['filename', 'owner', 'ids'])
+        self.assertEqual(information['ids']['contents'][0]['text'], '7004')
+        information = self.checker.get_content(result, ['area'])
+        self.assertEqual(information['area']['text'], 'Werkabbildungen')
+        self.assertFalse('suffix' in information.keys())
+        self.assertEqual(self.checker.get_fields(), ['owner', 'area', 'areaCategory', 'ids', 'date', 'text', 'suffix', 'extension'])
+        for name in [ 'kw1a_v007004_2022-05-20_museumsnacht-2022_s-zzz9-031.jpg', 'pd99_2022-05-20_museumsnacht-2022_s-031.jpg' ]:
+            result = self.checker.check_filename(Path(name))
+            with self.assertRaises(Exception):
+                self.checker.get_content(result, ['owner'])
+
+    def test_suggest_filename(self):
+        self.assertEqual(self.checker.suggest_filename('pd31_v007004_2022-05-20_Museumsnächt 2022_s-031.JPG'), ['pd31_v007004_2022-05-20_museumsnaecht-2022_s-031.jpg'])
+        self.assertEqual(self.checker.suggest_filename('kw1a_v007004_2022-05-20_museumsnacht-2022_s-m9x-031.jpg'), ['kw1a_v007004_2022-05-20_museumsnacht-2022_s-m9-031.jpg'])
+        self.assertEqual(self.checker.suggest_filename('kw1a_v007004_2022-05-20_museumsnacht-2022_s-031.jpg'), [])
+        result = self.checker.check_filename(Path('pd31_2022-05-20_museumsnacht-2022_s-v2o-031.jpg'))
+        with self.assertRaisesRegex(Exception, 'did you mean v2 or v20'):
+            self.checker.get_content(result)
+
     def test_parse_title(self):
         information = self.checker.parse_title('_asdf-asdf', 'test')
         self.assertEqual(information['text'], 'Asdf Asdf')
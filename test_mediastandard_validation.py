@@ -1,9 +1,12 @@
+from contextlib import redirect_stderr, redirect_stdout
+import io
+import json
 import unittest
 from pathlib import Path
 
 # my module
 from mediastandard import MediaStandard
-from simple_mediastandard_validation import get_filenames
+from simple_mediastandard_validation import Printer, RecordWriter, get_filenames, main, parse_options
 
 
 class TestMediastandard(unittest.TestCase):
@@ -39,6 +42,34 @@ class TestMediastandard(unittest.TestCase):
         self.assertFalse(result.check_passed)
         print(result.error_msg)
 
+    def test_parse_options(self):
+        options = parse_options(['-F', 'owner,ids', '--output=csv', 'test_dir'])
+        self.assertEqual(options['fields'], ['owner', 'ids'])
+        self.assertEqual(options['output'], 'csv')
+        self.assertTrue(parse_options(['--output=xml'])['showUsage'])
+
+    def test_record_writer(self):
+        result = self.checker.check_filename(Path('kw1a_v007004_2022-05-20_museumsnacht-2022_s-031.jpg'))
+        information = self.checker.get_content(result, ['owner', 'ids'])
+        stream = io.StringIO()
+        writer = RecordWriter('ndjson', ['owner', 'ids'], stream)
+        writer.write(result.name, information)
+        writer.write('A.jpg', error_msg='Grossbuchstaben vorhanden!')
+        records = [ json.loads(line) for line in stream.getvalue().splitlines() ]
+        self.assertEqual(records[0]['owner'], 'Kupferstichkabinett')
+        self.assertEqual(records[0]['ids'], ['7004'])
+        self.assertEqual(records[1]['status'], 'FAIL')
+        stream = io.StringIO()
+        writer = RecordWriter('csv', ['owner', 'ids'], stream)
+        writer.write(result.name, information)
+        self.assertEqual(stream.getvalue().splitlines()[1], f'{result.name},OK,,Kupferstichkabinett,7004')
+
+    def test_ndjson_output(self):
+        with redirect_stdout(io.StringIO()) as output, redirect_stderr(io.StringIO()):
+            self.assertEqual(main(['-v', '-o', 'ndjson', 'test_dir'], Printer()), 0)
+        records = [ json.loads(line) for line in output.getvalue().splitlines() ]
+        self.assertEqual(len(records), 8)
+
     def test_get_filenames(self):
         paths = [ Path('test_dir') ]
         filenames = get_filenames(paths)
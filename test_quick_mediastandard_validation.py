@@ -0,0 +1,95 @@
+import io
+import os
+import shutil
+from contextlib import redirect_stderr, redirect_stdout
+import subprocess
+import sys
+import tempfile
+from typing import List
+import unittest
+
+# my module
+from quick_mediastandard_validation import JSON, main, parse_options
+
+LAZY_MODULES = [ 'colorama', 'concurrent.futures', 'csv', 'json', 'typing' ]
+
+def import_times(argv: List[str], runs: int = 5) ->dict:
+    """Return the best cumulative import time (us) of each module imported by running python -X importtime argv
+    """
+    times = {}
+    for _ in range(runs):
+        stderr = subprocess.run([ sys.executable, '-X', 'importtime' ] + argv, capture_output=True, text=True).stderr
+        for line in stderr.splitlines()[1:]:
+            if line.startswith('import time:'):
+                self_time, cumulative, name = line[len('import time:'):].split('|')
+                times[name.strip()] = min(times.get(name.strip(), int(cumulative)), int(cumulative))
+    return times
+
+
+class TestQuickMediastandardValidation(unittest.TestCase):
+
+    def setUp(self):
+        """Use a copy of the json without cache, so a fresh clone behaves like a second run
+        """
+        self.tmp_dir = tempfile.mkdtemp()
+        self.json_file = os.path.join(self.tmp_dir, JSON)
+        shutil.copy(JSON, self.json_file)
+        self.cache_file = os.path.join(self.tmp_dir, '__pycache__', JSON + '.marshal')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_main(self):
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(main(['pd31_2022-05-20_museumsnacht-2022_s-031.jpg']), 0)
+            self.assertEqual(main(['pd31_2022-05-20_museumsnacht-2022_s-031.jpg', 'A.jpg']), 1)
+        self.assertTrue('A.jpg\t[FAIL]' in output.getvalue())
+
+    def test_parse_options(self):
+        name = 'pd31_2022-05-20_museumsnacht-2022_s-031.jpg'
+        for argv in ([ '-jother.json', name ], [ '-j', 'other.json', name ], [ name, '--json=other.json' ],
+                     [ name, '--json', 'other.json' ], [ '--js=other.json', name ]):
+            options = parse_options(argv)
+            self.assertEqual((options['json'], options['args'], options['message']), ('other.json', [ name ], 0))
+        options = parse_options([ '-pj', 'other.json', '-', '--', '-v' ])
+        self.assertEqual((options['patternOnly'], options['json'], options['args']), (True, 'other.json', [ '-', '-v' ]))
+        self.assertEqual(parse_options([ name ])['json'], JSON)
+        with redirect_stderr(io.StringIO()):
+            for argv in ([ name, '-j' ], [ name, '--json' ], [ name, '-v' ], [ name, '--bogus' ], [ '--help=x' ]):
+                options = parse_options(argv)
+                self.assertEqual((options['showUsage'], options['message']), (True, 2), argv)
+
+    def test_option_errors(self):
+        name = 'pd31_2022-05-20_museumsnacht-2022_s-031.jpg'
+        with redirect_stdout(io.StringIO()) as output, redirect_stderr(io.StringIO()) as errors:
+            self.assertEqual(main([ name, '-j' ]), 2)
+            self.assertEqual(main([ name, '-v' ]), 2)
+            self.assertEqual(main([ '--', '-v' ]), 1)
+        self.assertTrue('[OK]' not in output.getvalue())
+        self.assertTrue('option -v not recognized' in errors.getvalue())
+        self.assertTrue('-v\t[FAIL]' in output.getvalue())
+
+    def test_cold_start(self):
+        name = 'pd31_2022-05-20_museumsnacht-2022_s-031.jpg'
+        self.assertFalse(os.path.exists(self.cache_file))
+        cold = subprocess.run([ sys.executable, '-X', 'importtime', 'quick_mediastandard_validation.py', '-j', self.json_file, name ],
+                              capture_output=True, text=True)
+        self.assertEqual(cold.returncode, 0, cold.stderr)
+        self.assertTrue(f'{name}\t[OK]' in cold.stdout)
+        self.assertTrue(os.path.exists(self.cache_file))
+
+    def test_import_time(self):
+        name = 'pd31_2022-05-20_museumsnacht-2022_s-031.jpg'
+        # the first run builds the cache, only later runs are measured
+        subprocess.run([ sys.executable, 'quick_mediastandard_validation.py', '-j', self.json_file, name ], capture_output=True, check=True)
+        quick = import_times([ 'quick_mediastandard_validation.py', '-j', self.json_file, name ])
+        full = import_times([ '-c', 'import mediastandard_validation' ])
+        print(f'\nimport time: quick {quick["mediastandard"]}us (mediastandard), full {full["mediastandard_validation"]}us (mediastandard_validation)')
+        for module in LAZY_MODULES:
+            self.assertFalse(module in quick.keys(), f'{module} imported')
+        self.assertTrue('colorama' not in full.keys())
+        self.assertLess(quick['mediastandard'], full['mediastandard_validation'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,11 @@
+import os
+import re
 import unittest
 from pathlib import Path
 from colorama import Fore
 
 # my module
-from result import Result
+from result import Result, message_text
 from rule import Rule
 
 
@@ -15,6 +17,22 @@ class TestRule(unittest.TestCase):
         result = rule.applies('pd31_v007004_2022-05-20_Museumsnacht-2022_s-031.jpg')
         self.assertEqual(result.check_passed, False)
         self.assertTrue(ruleDict['onError'][0]['error'] in result.error_msg)
+        self.assertEqual(result.error_msg, ruleDict['error'] + ': ' + ruleDict['onError'][0]['error'])
+        self.assertEqual(result.filename, Path('pd31_v007004_2022-05-20_Museumsnacht-2022_s-031.jpg'))
+
+    def testCompactResult(self):
+        result = Result(Path('test_dir/a'), False, 'Fehler')
+        self.assertFalse(hasattr(result, '__dict__'))
+        self.assertEqual(result.path, 'test_dir/a')
+        self.assertEqual(result.name, 'a')
+        self.assertEqual(message_text(result.error_code), 'Fehler')
+        self.assertEqual(Result('b', False, 'Fehler').error_code, result.error_code)
+        m = re.match('(?P<before>.*)(?P<error>[A-Z]+)(?P<after>.*)', 'aBc')
+        result.addMessage('Grossbuchstaben!', m)
+        result.addMessage('Umlaute!', re.match('.*', 'aBc'))
+        self.assertEqual(result.error_msg, 'Fehler: Grossbuchstaben! Umlaute!')
+        self.assertEqual(result.groups['error'], 'B')
+        self.assertEqual(result.getFilenameInfo({ 'default': '', 'fail': '', 'reset': '' }), f'{Path("test_dir").absolute()}{os.sep}aBc')
 
 
 if __name__ == "__main__":
@@ -0,0 +1,58 @@
+import os
+from pathlib import Path
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+# my module
+from scanner import scan_paths
+
+
+def walk(paths):
+    filenames = []
+    for path in paths:
+        if path.is_dir():
+            filenames += walk(list(path.glob('*')))
+        else:
+            filenames.append(path)
+    return filenames
+
+
+class TestScanner(unittest.TestCase):
+
+    def test_scan_paths(self):
+        paths = [ Path('test_dir'), Path('README.md'), Path('does_not_exist.jpg') ]
+        self.assertEqual(list(scan_paths(paths)), walk(paths))
+        self.assertEqual(list(scan_paths(paths, threads=1)), walk(paths))
+        self.assertEqual(sorted(scan_paths(paths, ordered=False)), sorted(walk(paths)))
+
+    def test_descend(self):
+        filenames = list(scan_paths([ Path('test_dir') ], lambda path: path.name != 'sub'))
+        self.assertTrue(Path('test_dir/sub') in filenames)
+        self.assertEqual(len(filenames), 4)
+
+    def test_slow_listing(self):
+        """Listings on a high-latency mount are waited for concurrently
+        """
+        scandir = os.scandir
+        def slow_scandir(path):
+            time.sleep(0.02)
+            return scandir(path)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for i in range(8):
+                for j in range(4):
+                    os.makedirs(os.path.join(tmp_dir, f'dir{i}', f'sub{j}'))
+                    Path(tmp_dir, f'dir{i}', f'sub{j}', 'a.jpg').touch()
+            seconds = {}
+            with mock.patch('scanner.os.scandir', slow_scandir):
+                for threads in (1, 16):
+                    start = time.perf_counter()
+                    filenames = list(scan_paths([ Path(tmp_dir) ], threads=threads))
+                    seconds[threads] = time.perf_counter() - start
+                    self.assertEqual(len(filenames), 32)
+        self.assertLess(seconds[16] * 3, seconds[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+from contextlib import redirect_stdout
+import io
+import json
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# my module
+from shard import in_shard, merge, parse_shard, select_shard
+from simple_mediastandard_validation import Printer, main
+
+
+class TestShard(unittest.TestCase):
+
+    def test_parse_shard(self):
+        self.assertEqual(parse_shard('2/4'), (2, 4))
+        for shard in [ '0/4', '5/4', '1/0', '1', 'a/b' ]:
+            with self.assertRaises(ValueError):
+                parse_shard(shard)
+
+    def test_select_shard(self):
+        paths = [ Path('test_dir') ]
+        selected = []
+        for index in range(1, 4):
+            selected += select_shard(paths, (index, 3), lambda path: path.is_dir())
+        self.assertEqual(sorted(selected), sorted(Path('test_dir').glob('*')))
+        self.assertEqual(select_shard(paths, None, lambda path: path.is_dir()), paths)
+        self.assertTrue(in_shard('sub', (1, 1)))
+
+    def test_sharded_processes(self):
+        count = 3
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            parts = [ Path(tmp_dir) / f'part{index}.ndjson' for index in range(1, count+1) ]
+            outputs = [ part.open('w', encoding='utf-8') for part in parts ]
+            processes = [ subprocess.Popen([ sys.executable, 'mediastandard_validation.py', '-o', 'ndjson', '-s', f'{index+1}/{count}', 'test_dir' ], stdout=outputs[index])\
+                    for index in range(count) ]
+            for process, output in zip(processes, outputs):
+                self.assertEqual(process.wait(), 0)
+                output.close()
+            output = io.StringIO()
+            counters = merge(parts, output)
+        records = [ json.loads(line) for line in output.getvalue().splitlines() ]
+        self.assertEqual(records.pop()['summary'], { 'total': 8, 'OK': 0, 'FAIL': 8 })
+        self.assertEqual(counters['total'], 8)
+        self.assertEqual(counters['FAIL'], 8)
+        self.assertEqual([ record['filename'] for record in records ], sorted([ str(path) for path in Path('test_dir').rglob('*') if path.is_file() ]))
+
+    def test_merge_chunks(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            parts = [ Path(tmp_dir) / 'part1.csv', Path(tmp_dir) / 'part2.csv' ]
+            parts[0].write_text('filename,status\nd,OK\na,FAIL\nc,OK\n', encoding='utf-8')
+            parts[1].write_text('filename,status\nb,OK\ne,FAIL\n', encoding='utf-8')
+            output = io.StringIO()
+            counters = merge(parts, output, chunk_size=2)
+        self.assertEqual(output.getvalue().splitlines(), [ 'filename,status', 'a,FAIL', 'b,OK', 'c,OK', 'd,OK', 'e,FAIL' ])
+        self.assertEqual(counters, { 'total': 5, 'OK': 3, 'FAIL': 2 })
+
+    def test_merge_summaries(self):
+        names = [ 'pd31_2022-05-20_museumsnacht-2022_s-031.jpg', 'pd31_2022-05-20_fest_s-001.jpg', 'A.jpg' ]
+        for output_format, suffix in [ ('ndjson', '.ndjson'), ('csv', '.csv') ]:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                archive = Path(tmp_dir) / 'archive'
+                archive.mkdir()
+                for name in names:
+                    (archive / name).touch()
+                parts = [ Path(tmp_dir) / f'part{index}{suffix}' for index in range(1, 3) ]
+                for index, part in enumerate(parts):
+                    with open(part, 'w', encoding='utf-8', newline='') as f, redirect_stdout(f):
+                        main([ '-f', '-o', output_format, '-s', f'{index+1}/2', str(archive) ], Printer())
+                output = io.StringIO()
+                counters = merge(parts, output)
+            self.assertEqual((counters['total'], counters['OK'], counters['FAIL']), (3, 2, 1))
+            self.assertTrue('SUMMARY' in output.getvalue().splitlines()[-1])
+            self.assertTrue('A.jpg' in output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
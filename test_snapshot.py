@@ -0,0 +1,90 @@
+from contextlib import redirect_stdout
+import io
+import os
+from pathlib import Path
+import tempfile
+import unittest
+
+# my module
+from simple_mediastandard_validation import Printer, main
+from snapshot import SnapshotWriter, VERDICT_FAIL, VERDICT_OK, diff_snapshots, read_snapshot
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.old = Path(self.tmp_dir.name) / 'old.snapshot'
+        self.new = Path(self.tmp_dir.name) / 'new.snapshot'
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_snapshot_writer(self):
+        with SnapshotWriter(self.old, chunk_size=2) as snapshot:
+            snapshot.add(Path('b/c.jpg'), VERDICT_OK, { 'owner': 'p' })
+            snapshot.add(Path('a/x.jpg'), VERDICT_FAIL)
+            snapshot.add('b/a.jpg', VERDICT_FAIL)
+            snapshot.add('top.jpg', VERDICT_OK)
+        entries = list(read_snapshot(self.old))
+        self.assertEqual(sorted([ entry.path for entry in entries ]), [ 'a/x.jpg', 'b/a.jpg', 'b/c.jpg', 'top.jpg' ])
+        self.assertEqual([ entry.key for entry in entries ], sorted([ entry.key for entry in entries ]))
+        self.assertEqual([ entry.groups for entry in entries if entry.name == 'c.jpg' ], [ '{"owner":"p"}' ])
+
+    def test_snapshot_writer_exception(self):
+        with self.assertRaises(KeyboardInterrupt):
+            with SnapshotWriter(self.old, chunk_size=1) as snapshot:
+                snapshot.add('a/x.jpg', VERDICT_OK)
+                snapshot.add('a/y.jpg', VERDICT_OK)
+                raise KeyboardInterrupt()
+        self.assertFalse(self.old.exists())
+        self.assertIsNone(snapshot.tmp_dir)
+
+    def test_validation_snapshot(self):
+        with redirect_stdout(io.StringIO()):
+            main([ '-f', '-w', str(self.old), 'test_dir' ], Printer())
+            main([ '-f', '-w', str(self.new), os.path.abspath('test_dir') ], Printer())
+        self.assertTrue(all([ os.path.isabs(entry.path) for entry in read_snapshot(self.old) ]))
+        self.assertEqual(list(diff_snapshots(self.old, self.new)), [])
+
+    def test_diff_snapshots(self):
+        with SnapshotWriter(self.old) as snapshot:
+            snapshot.add('d/pd31_2022-05-20_museumsnacht_s-031.jpg', VERDICT_OK)
+            snapshot.add('d/pd31_2022-05-20_fest_s-001.jpg', VERDICT_FAIL)
+            snapshot.add('d/Museumsnacht 2022.jpg', VERDICT_FAIL)
+            snapshot.add('e/gone.jpg', VERDICT_OK)
+            snapshot.add('e/ok.jpg', VERDICT_OK)
+        with SnapshotWriter(self.new) as snapshot:
+            snapshot.add('d/pd31_2022-05-20_museumsnacht_s-031.jpg', VERDICT_FAIL)
+            snapshot.add('d/pd31_2022-05-20_fest_s-001.jpg', VERDICT_OK)
+            snapshot.add('d/museumsnacht-2022.jpg', VERDICT_OK)
+            snapshot.add('e/ok.jpg', VERDICT_OK)
+            snapshot.add('f/new.jpg', VERDICT_FAIL)
+        changes = { change['path']: change for change in diff_snapshots(self.old, self.new) }
+        self.assertEqual(len(changes), 5)
+        self.assertEqual(changes['d/pd31_2022-05-20_museumsnacht_s-031.jpg']['change'], 'failed')
+        self.assertEqual(changes['d/pd31_2022-05-20_fest_s-001.jpg']['change'], 'fixed')
+        self.assertEqual(changes['d/Museumsnacht 2022.jpg']['change'], 'renamed')
+        self.assertEqual(changes['d/Museumsnacht 2022.jpg']['new_path'], 'd/museumsnacht-2022.jpg')
+        self.assertEqual(changes['e/gone.jpg']['change'], 'deleted')
+        self.assertEqual(changes['f/new.jpg']['change'], 'added')
+
+    def test_bulk_renames(self):
+        with SnapshotWriter(self.old) as snapshot:
+            for i in range(120):
+                snapshot.add(f'/a/Museumsnacht {i:03}.jpg', VERDICT_FAIL)
+                snapshot.add(f'/b/pd31_2022-05-20_fest_s-{i:03}.jpg', VERDICT_FAIL)
+            snapshot.add('/b/gone.jpg', VERDICT_OK)
+        with SnapshotWriter(self.new) as snapshot:
+            for i in range(120):
+                snapshot.add(f'/a/museumsnacht-{i:03}.jpg', VERDICT_OK)
+                snapshot.add(f'/b/pd31_2022-05-20_fest_m8_s-{i:03}.jpg', VERDICT_OK)
+        changes = list(diff_snapshots(self.old, self.new))
+        renames = { change['path']: change['new_path'] for change in changes if change['change'] == 'renamed' }
+        self.assertEqual(len(renames), 240)
+        self.assertEqual(renames['/a/Museumsnacht 007.jpg'], '/a/museumsnacht-007.jpg')
+        self.assertEqual(renames['/b/pd31_2022-05-20_fest_s-042.jpg'], '/b/pd31_2022-05-20_fest_m8_s-042.jpg')
+        self.assertEqual([ change['path'] for change in changes if change['change'] != 'renamed' ], [ '/b/gone.jpg' ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+# my module
+from vocabulary import Trie
+
+
+class TestTrie(unittest.TestCase):
+    def setUp(self):
+        self.trie = Trie({ 'm1': 'Datenträger 1', 'm8': 'Datenträger 8', 'v20': 'Vitrine 20', 'nb': 'Neubau' })
+
+    def test_get(self):
+        self.assertEqual(len(self.trie), 4)
+        self.assertEqual(self.trie.get('v20'), 'Vitrine 20')
+        self.assertIsNone(self.trie.get('v2'))
+        self.assertTrue('nb' in self.trie)
+        self.assertFalse('n' in self.trie)
+
+    def test_suggest(self):
+        self.assertEqual(self.trie.suggest('m9'), [ 'm1', 'm8' ])
+        self.assertEqual(self.trie.suggest('v2o'), [ 'v20' ])
+        self.assertEqual(self.trie.suggest('xyz'), [])
+        self.assertEqual(self.trie.suggest('m8', limit=1), [ 'm8' ])
+
+
+if __name__ == "__main__":
+    unittest.main()
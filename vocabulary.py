@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#    Copyright (C) Christian Steiner 2026  {{{1
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/> 1}}}
+
+DEBUG = False 
+END = ''
+
+class Trie:
+    """This class represents a prefix trie over the keys of a content table of the mediastandard.
+
+    Nodes are dicts from a character to the next node, END marks a node where a key ends
+    and holds (key, value).
+    """
+    __slots__ = ('root', 'size')
+
+    def __init__(self, table: dict = None): 
+        self.root = {}
+        self.size = 0
+        if table is not None:
+            for key, value in table.items():
+                self.insert(key, value)
+
+    def insert(self, key: str, value: object):
+        """Insert key with value
+        """
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+        if END not in node:
+            self.size += 1
+        node[END] = (key, value)
+
+    def get(self, key: str, default: object = None) ->object:
+        """Return the value of key or default
+        """
+        node = self.root
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                return default
+        return node[END][1] if END in node else default
+
+    def __contains__(self, key: str) ->bool:
+        return self.get(key, END) is not END
+
+    def __len__(self) ->int:
+        return self.size
+
+    def suggest(self, word: str, max_distance: int = None, limit: int = 3) ->list[str]:
+        """Return up to limit keys within max_distance (Levenshtein) of word, nearest first.
+
+        The distance rows are computed along the trie, branches that cannot get
+        within max_distance are not visited. The default max_distance depends on
+        the length of word (1 for codes up to 3 characters, else 2).
+        """
+        if max_distance is None:
+            max_distance = 1 if len(word) <= 3 else 2
+        matches = []
+        first_row = list(range(len(word) + 1))
+        for char, node in self.root.items():
+            if char != END:
+                self._search(node, char, word, first_row, max_distance, matches)
+        matches.sort()
+        return [ key for distance, key in matches[:limit] ]
+
+    def _search(self, node: dict, char: str, word: str, previous_row: list[int], max_distance: int, matches: list[tuple[int, str]]):
+        current_row = [ previous_row[0] + 1 ]
+        for column in range(1, len(word) + 1):
+            current_row.append(min(current_row[column-1] + 1, previous_row[column] + 1, previous_row[column-1] + (word[column-1] != char)))
+        if current_row[-1] <= max_distance and END in node:
+            matches.append((current_row[-1], node[END][0]))
+        if min(current_row) <= max_distance:
+            for next_char, child in node.items():
+                if next_char != END:
+                    self._search(child, next_char, word, current_row, max_distance, matches)
+
+class Index(dict):
+    """This class represents the tries of the content tables of a mediastandard.
+
+    The trie of a table is built on first access.
+    """
+    def __init__(self, tables: dict): 
+        super().__init__()
+        self.tables = { key: table for key, table in tables.items() if type(table) is dict }
+
+    def __contains__(self, key: str) ->bool:
+        return key in self.tables
+
+    def __missing__(self, key: str) ->Trie:
+        self[key] = Trie(self.tables[key])
+        return self[key]